@@ -1,68 +1,123 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-
-def score_endurance_event(
-    distance_km: float,
-    elevation_meters: float,
-    event_type: str = "run",
-    roughness: float = 0.0,
-    draft_percentage: float = 0.0,
-    temperature_c: float = 20.0,
-    avg_altitude_m: float = 0.0
-) -> float:
-    """Calculate normalized grit points for endurance events"""
-    # Check minimum distances
-    MIN_RUN_DISTANCE = 21.2  # Half marathon
-    MIN_CYCLE_DISTANCE = 70.0
-    
-    if (event_type in ["run", "trail_run"] and distance_km < MIN_RUN_DISTANCE) or \
-       (event_type in ["road_cycle", "gravel", "mtb"] and distance_km < MIN_CYCLE_DISTANCE):
-        return 0.0
-    
-    DISTANCE_FACTOR = 3.0
-    ELEVATION_FACTOR = 4.0
-    
-    terrain_factor = 1 + roughness
-    
-    # Calculate draft factor based on percentage (0% = 1.0, 100% = 0.7)
-    DRAFT_FACTOR = 1.0 - (draft_percentage / 100 * 0.3)
-    
-    NORMALIZATION_FACTOR = 2.0 / 42.2
+import plotly.graph_objects as go
+import polars as pl
 
-    if event_type in ["run", "trail_run"]:
-        elevation_score = elevation_meters / 400
-        base_score = distance_km * NORMALIZATION_FACTOR + elevation_score
-    else:
-        distance_km = distance_km / DISTANCE_FACTOR
-        elevation_meters = elevation_meters / ELEVATION_FACTOR
-        elevation_score = elevation_meters / 400
-        base_score = distance_km * NORMALIZATION_FACTOR + elevation_score
-    
-    # Temperature adjustment
-    if temperature_c <= 10:
-        temp_adjustment = (temperature_c - 10) * 0.05
-    elif temperature_c <= 20:
-        temp_adjustment = 0
-    else:
-        temp_adjustment = (temperature_c - 20) * 0.1
+from scoring import score_endurance_event
+
+# Columns of the event log and their dtypes; stored as a Polars DataFrame in session state
+_EVENT_SCHEMA = {
+    'name': pl.String,
+    'type': pl.String,
+    'distance': pl.Float64,
+    'elevation': pl.Float64,
+    'roughness': pl.Float64,
+    'draft_pct': pl.Float64,
+    'temp': pl.Float64,
+    'altitude': pl.Float64,
+    'score': pl.Float64
+}
+
+@st.cache_resource(show_spinner=False)
+def _lookup_tables():
+    """Build the per-type display lookups once per process, shared across sessions"""
+    return dict(
+        # Display labels per event type, in selectbox order
+        type_labels={
+            "run": "Road Running",
+            "trail_run": "Trail Running",
+            "road_cycle": "Road Cycling",
+            "gravel": "Gravel Cycling",
+            "mtb": "Mountain Biking"
+        },
+        # Bar colors per event type (Plotly's default qualitative palette)
+        colors={
+            "run": "#636EFA",
+            "trail_run": "#EF553B",
+            "road_cycle": "#00CC96",
+            "gravel": "#AB63FA",
+            "mtb": "#FFA15A"
+        }
+    )
+
+_TABLES = _lookup_tables()
+_TYPE_LABELS = _TABLES['type_labels']
+_COLOR_MAP = _TABLES['colors']
+
+@st.cache_resource(show_spinner=False)
+def _warmup_score_kernel():
+    """Run the scoring kernel once per process; it is compiled (or loaded from cache) when scoring is imported"""
+    score_endurance_event(42.2, 0.0)
+
+# Numeric display formats for the event table; values stay numeric so columns sort correctly
+_COLUMN_CONFIG = {
+    'distance': st.column_config.NumberColumn(format='%.1f'),
+    'elevation': st.column_config.NumberColumn(format='%.0f'),
+    'roughness': st.column_config.NumberColumn(format='%.1f'),
+    'draft_pct': st.column_config.NumberColumn(format='%.0f'),
+    'temp': st.column_config.NumberColumn(format='%.1f'),
+    'altitude': st.column_config.NumberColumn(format='%.0f'),
+    'score': st.column_config.NumberColumn(format='%.2f')
+}
+
+def reset_events():
+    """Start an empty event log and chart in session state"""
+    st.session_state.events = pl.DataFrame(schema=_EVENT_SCHEMA)
+    st.session_state.fig = go.Figure()
+    # One bar trace per event, grouped in the legend by event type;
+    # relative stacks events sharing a name (like px.bar) and keeps each bar full width
+    st.session_state.fig.update_layout(
+        title='Event Comparison',
+        xaxis_title='Event',
+        yaxis_title='Grit Points',
+        yaxis_hoverformat='.2f',
+        barmode='relative',
+        legend_title_text='Event Type'
+    )
+
+def on_submit():
+    """Score only the new event and append it to the log and chart"""
+    state = st.session_state
+    score = score_endurance_event(
+        state.distance,
+        state.elevation,
+        state.event_type,
+        state.roughness,
+        state.draft_percentage,
+        state.temperature,
+        state.altitude
+    )
     
-    # Altitude adjustment
-    if avg_altitude_m < 500:
-        altitude_adjustment = (avg_altitude_m / 1000) * 0.8
-    else:
-        altitude_adjustment = 0
+    new_event = {
+        'name': state.event_name,
+        'type': state.event_type,
+        'distance': state.distance,
+        'elevation': state.elevation,
+        'roughness': state.roughness,
+        'draft_pct': state.draft_percentage,
+        'temp': state.temperature,
+        'altitude': state.altitude,
+        'score': score
+    }
     
-    # Apply all factors
-    terrain_adjusted = base_score * terrain_factor
-    draft_adjusted = terrain_adjusted * DRAFT_FACTOR
-    final_score = draft_adjusted + temp_adjustment + altitude_adjustment
+    # Only the first bar of each type gets a legend entry
+    first_of_type = state.event_type not in state.events['type']
     
-    return round(final_score, 2)
+    state.events = state.events.vstack(pl.DataFrame([new_event], schema=_EVENT_SCHEMA)).rechunk()
+    state.fig.add_bar(
+        x=[state.event_name],
+        y=[score],
+        marker_color=_COLOR_MAP[state.event_type],
+        name=_TYPE_LABELS[state.event_type],
+        legendgroup=state.event_type,
+        showlegend=first_of_type
+    )
 
 # Set page config
 st.set_page_config(page_title="Grit Event Scorer", layout="wide")
 
+# Exercise the scoring path once per process; compilation already happened at import
+_warmup_score_kernel()
+
 # Title and description
 st.title("Grit Calculator")
 
@@ -74,114 +129,64 @@ with col1:
     
     # Event input form
     with st.form("event_form"):
-        event_name = st.text_input("Event Name")
-        event_type = st.selectbox(
+        st.text_input("Event Name", key='event_name')
+        st.selectbox(
             "Event Type",
-            ["run", "trail_run", "road_cycle", "gravel", "mtb"],
-            format_func=lambda x: {
-                "run": "Road Running",
-                "trail_run": "Trail Running",
-                "road_cycle": "Road Cycling",
-                "gravel": "Gravel Cycling",
-                "mtb": "Mountain Biking"
-            }[x]
+            list(_TYPE_LABELS),
+            format_func=_TYPE_LABELS.__getitem__,
+            key='event_type'
         )
         
         # Basic metrics
-        distance = st.number_input("Distance (km)", min_value=0.0, value=42.2)
-        elevation = st.number_input("Elevation Gain (meters)", min_value=0.0, value=0.0)
+        st.number_input("Distance (km)", min_value=0.0, value=42.2, key='distance')
+        st.number_input("Elevation Gain (meters)", min_value=0.0, value=0.0, key='elevation')
         
         # Roughness slider
-        roughness = st.slider(
+        st.slider(
             "Terrain Roughness (0 = smooth, 1 = extreme chonk)",
             min_value=0.0,
             max_value=1.0,
             value=0.0,
             step=0.1,
-            help="0 = road/track, 1.0 = extreme technical terrain"
+            help="0 = road/track, 1.0 = extreme technical terrain",
+            key='roughness'
         )
         
         # New draft percentage slider
-        draft_percentage = st.slider(
+        st.slider(
             "Drafting Percentage",
             min_value=0.0,
             max_value=100.0,
             value=0.0,
             step=5.0,
-            help="0% = solo riding, 100% = full draft benefit"
+            help="0% = solo riding, 100% = full draft benefit",
+            key='draft_percentage'
         )
         
         # Temperature and altitude
-        temperature = st.number_input("Average Temperature (°C)", min_value=-20.0, max_value=50.0, value=20.0)
-        altitude = st.number_input("Average Altitude (meters)", min_value=0.0, max_value=5000.0, value=0.0)
+        st.number_input("Average Temperature (°C)", min_value=-20.0, max_value=50.0, value=20.0, key='temperature')
+        st.number_input("Average Altitude (meters)", min_value=0.0, max_value=5000.0, value=0.0, key='altitude')
         
-        submitted = st.form_submit_button("Calculate Grit Points")
+        # Scoring runs in the callback, only when the button is actually pressed
+        st.form_submit_button("Calculate Grit Points", on_click=on_submit)
 
 # Initialize session state
 if 'events' not in st.session_state:
-    st.session_state.events = []
-
-# Calculate and store score if form is submitted
-if submitted:
-    score = score_endurance_event(
-        distance,
-        elevation,
-        event_type,
-        roughness,
-        draft_percentage,
-        temperature,
-        altitude
-    )
-    
-    new_event = {
-        'name': event_name,
-        'type': event_type,
-        'distance': distance,
-        'elevation': elevation,
-        'roughness': roughness,
-        'draft_pct': draft_percentage,
-        'temp': temperature,
-        'altitude': altitude,
-        'score': score
-    }
-    
-    st.session_state.events.append(new_event)
+    reset_events()
 
 # Display results
 with col2:
     st.subheader("Event Comparison")
     
-    if st.session_state.events:
-        # Convert events to DataFrame
-        df = pd.DataFrame(st.session_state.events)
-        
+    if not st.session_state.events.is_empty():
         # Display formatted table
-        st.dataframe(
-            df.style.format({
-                'distance': '{:.1f}',
-                'elevation': '{:.0f}',
-                'roughness': '{:.1f}',
-                'draft_pct': '{:.0f}',
-                'temp': '{:.1f}',
-                'altitude': '{:.0f}',
-                'score': '{:.2f}'
-            }),
-            hide_index=True
-        )
+        st.dataframe(st.session_state.events.to_pandas(), hide_index=True, column_config=_COLUMN_CONFIG)
         
-        # Create bar chart
-        fig = px.bar(
-            df,
-            x='name',
-            y='score',
-            title='Event Comparison',
-            color='type',
-            labels={'name': 'Event', 'score': 'Grit Points'}
-        )
-        st.plotly_chart(fig)
+        # Display bar chart
+        st.plotly_chart(st.session_state.fig)
         
         if st.button("Clear All Events"):
-            st.session_state.events = []
+            reset_events()
     else:
         st.info("No events added")
 
@@ -0,0 +1,94 @@
+import numba
+import numpy as np
+import pandas as pd
+
+# Integer codes for event types; codes 0-1 are running, 2-4 are cycling
+TYPE_CODES = {"run": 0, "trail_run": 1, "road_cycle": 2, "gravel": 3, "mtb": 4}
+
+# Minimum qualifying distance per event type, indexed by type code
+MIN_DISTANCES = np.array([21.2, 21.2, 70.0, 70.0, 70.0])
+
+# Running:cycling ratios for distance and elevation
+DISTANCE_FACTOR = 3.0
+ELEVATION_FACTOR = 4.0
+
+# Marathon (42.2km) = 2.0 grit points
+NORMALIZATION_FACTOR = 2.0 / 42.2
+
+# Per-type multipliers with the running:cycling ratios, the marathon normalization
+# and the 400m-per-point elevation rate folded in, indexed by type code
+DISTANCE_SCALE = NORMALIZATION_FACTOR / np.array([1.0, 1.0, DISTANCE_FACTOR, DISTANCE_FACTOR, DISTANCE_FACTOR])
+ELEVATION_SCALE = 1.0 / (400 * np.array([1.0, 1.0, ELEVATION_FACTOR, ELEVATION_FACTOR, ELEVATION_FACTOR]))
+
+def _grit_points(
+    distance_km,
+    elevation_meters,
+    type_code,
+    roughness,
+    draft_percentage,
+    temperature_c,
+    avg_altitude_m
+):
+    """Grit point formula shared by the Numba kernel and the vectorized scorer
+
+    Uses only lookup tables, arithmetic and NumPy ufuncs, so the same body
+    compiles for scalars under Numba and runs on whole columns under NumPy.
+    """
+    base_score = distance_km * DISTANCE_SCALE[type_code] + elevation_meters * ELEVATION_SCALE[type_code]
+    
+    terrain_factor = 1 + roughness
+    
+    # Draft factor based on percentage (0% = 1.0, 100% = 0.7)
+    draft_factor = 1.0 - draft_percentage * 0.003
+    
+    # Temperature adjustment: penalty below 10C, bonus above 20C
+    temp_adjustment = np.minimum(temperature_c - 10, 0.0) * 0.05 + np.maximum(temperature_c - 20, 0.0) * 0.1
+    
+    # Altitude adjustment: +0.8 per 1000m above sea level, 0 below 500m
+    altitude_adjustment = (avg_altitude_m >= 500) * avg_altitude_m * 0.0008
+    
+    # Apply all factors
+    final_score = base_score * terrain_factor * draft_factor + temp_adjustment + altitude_adjustment
+    
+    # Events below the minimum distance score 0; adding +0.0 turns the -0.0
+    # a negative score masked by 0 would give back into +0.0
+    return (distance_km >= MIN_DISTANCES[type_code]) * final_score + 0.0
+
+# Explicit signature: compiled at import (and cached to disk) rather than on first call
+_score_kernel = numba.njit(
+    'float64(float64, float64, int64, float64, float64, float64, float64)',
+    cache=True,
+    fastmath=True
+)(_grit_points)
+
+def score_endurance_event(
+    distance_km: float,
+    elevation_meters: float,
+    event_type: str = "run",
+    roughness: float = 0.0,
+    draft_percentage: float = 0.0,
+    temperature_c: float = 20.0,
+    avg_altitude_m: float = 0.0
+) -> float:
+    """Calculate normalized grit points for endurance events"""
+    return _score_kernel(
+        distance_km,
+        elevation_meters,
+        TYPE_CODES[event_type],
+        roughness,
+        draft_percentage,
+        temperature_c,
+        avg_altitude_m
+    )
+
+def score_endurance_events_vec(df: pd.DataFrame) -> np.ndarray:
+    """Calculate grit points for every event in a DataFrame (app event-log columns) in one vectorized pass"""
+    code = df['type'].map(TYPE_CODES).to_numpy(dtype=np.int64)
+    dist = df['distance'].to_numpy(dtype=np.float64)
+    elev = df['elevation'].to_numpy(dtype=np.float64)
+    roughness = df['roughness'].to_numpy(dtype=np.float64)
+    draft_pct = df['draft_pct'].to_numpy(dtype=np.float64)
+    temp = df['temp'].to_numpy(dtype=np.float64)
+    alt = df['altitude'].to_numpy(dtype=np.float64)
+    
+    return _grit_points(dist, elev, code, roughness, draft_pct, temp, alt)
@@ -0,0 +1,113 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from scoring import TYPE_CODES, score_endurance_event, score_endurance_events_vec
+
+
+def _random_events(n, seed=0):
+    """Random events with the same columns as the app's event log"""
+    rng = random.Random(seed)
+    events = []
+    for _ in range(n):
+        event_type = rng.choice(list(TYPE_CODES))
+        event = {
+            'name': '',
+            'type': event_type,
+            'distance': rng.choice([rng.uniform(0, 300), 21.2, 70.0]),
+            'elevation': rng.uniform(0, 5000),
+            'roughness': rng.choice([0.0, 0.3, 1.0]),
+            'draft_pct': rng.uniform(0, 100),
+            'temp': rng.choice([rng.uniform(-20, 50), 10.0, 20.0]),
+            'altitude': rng.choice([rng.uniform(0, 1500), 500.0])
+        }
+        event['score'] = score_endurance_event(
+            event['distance'],
+            event['elevation'],
+            event['type'],
+            event['roughness'],
+            event['draft_pct'],
+            event['temp'],
+            event['altitude']
+        )
+        events.append(event)
+    return events
+
+
+def test_vec_scores_app_event_log():
+    events = _random_events(500)
+    df = pd.DataFrame(events)
+
+    scores = score_endurance_events_vec(df)
+
+    np.testing.assert_allclose(scores, df['score'].to_numpy(), rtol=0, atol=1e-12)
+
+
+def _reference_score(distance_km, elevation_meters, event_type, roughness, draft_percentage, temperature_c, avg_altitude_m):
+    """Plain branching form of the scoring rules, as written before the shared kernel"""
+    is_run = event_type in ["run", "trail_run"]
+    if distance_km < (21.2 if is_run else 70.0):
+        return 0.0
+
+    if not is_run:
+        distance_km = distance_km / 3.0
+        elevation_meters = elevation_meters / 4.0
+    base_score = distance_km * (2.0 / 42.2) + elevation_meters / 400
+
+    if temperature_c <= 10:
+        temp_adjustment = (temperature_c - 10) * 0.05
+    elif temperature_c <= 20:
+        temp_adjustment = 0.0
+    else:
+        temp_adjustment = (temperature_c - 20) * 0.1
+
+    if avg_altitude_m >= 500:
+        altitude_adjustment = (avg_altitude_m / 1000) * 0.8
+    else:
+        altitude_adjustment = 0.0
+
+    draft_factor = 1.0 - (draft_percentage / 100 * 0.3)
+    return base_score * (1 + roughness) * draft_factor + temp_adjustment + altitude_adjustment
+
+
+def test_scorers_match_reference():
+    events = _random_events(20000, seed=1)
+    df = pd.DataFrame(events)
+    expected = np.array([
+        _reference_score(
+            event['distance'],
+            event['elevation'],
+            event['type'],
+            event['roughness'],
+            event['draft_pct'],
+            event['temp'],
+            event['altitude']
+        )
+        for event in events
+    ])
+
+    for scores in (df['score'].to_numpy(), score_endurance_events_vec(df)):
+        np.testing.assert_allclose(scores, expected, rtol=0, atol=1e-12)
+        # assert_allclose treats -0.0 as equal to 0.0, so check the sign separately
+        assert not np.signbit(scores[scores == 0.0]).any()
+
+
+def test_below_minimum_distance_scores_positive_zero():
+    # A negative raw score (cold, short run) must still mask to +0.0
+    df = pd.DataFrame([{
+        'name': '',
+        'type': 'run',
+        'distance': 10.0,
+        'elevation': 0.0,
+        'roughness': 0.0,
+        'draft_pct': 0.0,
+        'temp': -20.0,
+        'altitude': 0.0
+    }])
+
+    vec_score = score_endurance_events_vec(df)[0]
+    scalar_score = score_endurance_event(10.0, 0.0, 'run', 0.0, 0.0, -20.0, 0.0)
+
+    assert vec_score == 0.0 and not np.signbit(vec_score)
+    assert scalar_score == 0.0 and not np.signbit(scalar_score)